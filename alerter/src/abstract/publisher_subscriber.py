@@ -122,9 +122,12 @@ class QueuingPublisherSubscriberComponent(PublisherSubscriberComponent, ABC):
         while not self._publishing_queue.empty():
             data = self._publishing_queue.queue[0]
             try:
+                # Data may be enqueued already serialized, in which case
+                # 'is_body_dict' is set to False.
                 self._rabbitmq.basic_publish_confirm(
                     exchange=data['exchange'], routing_key=data['routing_key'],
-                    body=data['data'], is_body_dict=True,
+                    body=data['data'],
+                    is_body_dict=data.get('is_body_dict', True),
                     properties=data['properties'], mandatory=data['mandatory'])
                 self._logger.debug(
                     "Sent %s to '%s' exchange", data['data'], data['exchange']
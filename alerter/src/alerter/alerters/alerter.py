@@ -99,9 +99,10 @@ class Alerter(QueuingPublisherSubscriberComponent):
                 raise e
 
     def _on_terminate(self, signum: int, stack: FrameType) -> None:
+        alerter_name = str(self)
         log_and_print("{} is terminating. Connections with RabbitMQ will be "
                       "closed, and afterwards the process will exit."
-                      .format(self), self.logger)
+                      .format(alerter_name), self.logger)
         self.disconnect_from_rabbit()
-        log_and_print("{} terminated.".format(self), self.logger)
+        log_and_print("{} terminated.".format(alerter_name), self.logger)
         sys.exit()
@@ -1,9 +1,9 @@
-import copy
-import json
 import logging
 from datetime import datetime
-from typing import List
+from types import FrameType
+from typing import Dict, List
 
+import orjson
 import pika.exceptions
 
 from src.alerter.alert_severities import Severity
@@ -17,12 +17,17 @@ from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils.constants.rabbitmq import (ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
                                           GITHUB_ALERTER_INPUT_QUEUE_NAME,
                                           GITHUB_TRANSFORMED_DATA_ROUTING_KEY,
-                                          GITHUB_ALERT_ROUTING_KEY, TOPIC)
+                                          GITHUB_ALERT_ROUTING_KEY, TOPIC,
+                                          MIN_PREFETCH_COUNT,
+                                          ACK_BATCH_FLUSH_INTERVAL_SECONDS)
 from src.utils.exceptions import (MessageWasNotDeliveredException,
-                                  ReceivedUnexpectedDataException,
                                   CannotAccessGitHubPageException,
                                   GitHubAPICallException)
 
+# Every alert is published with the same properties. Pika does not modify the
+# properties on publishing, so a single instance is shared by all the alerts.
+PERSISTENT_DELIVERY_PROPERTIES = pika.BasicProperties(delivery_mode=2)
+
 
 class GithubAlerter(Alerter):
     def __init__(self, alerter_name: str, logger: logging.Logger,
@@ -31,6 +36,13 @@ class GithubAlerter(Alerter):
         self._cannot_access_github_page = {}
         self._api_call_error = {}
 
+        # Consumed messages are acknowledged in batches, see _acknowledge
+        self._ack_batch_size = 1
+        self._no_of_unacked_messages = 0
+        self._last_unacked_delivery_tag = 0
+        self._ack_flush_timer = None
+        self._ack_flush_connection = None
+
     def _initialise_rabbitmq(self) -> None:
         # An alerter is both a consumer and producer, therefore we need to
         # initialise both the consuming and producing configurations.
@@ -58,10 +70,27 @@ class GithubAlerter(Alerter):
                                     auto_ack=False, exclusive=False,
                                     consumer_tag=None)
 
-        # Pre-fetch count is 10 times less the maximum queue size
+        # Pre-fetch count is 5 times less the maximum queue size, but never
+        # less than MIN_PREFETCH_COUNT. A small pre-fetch count keeps fewer
+        # unacknowledged messages in memory, but forces a broker round-trip
+        # for almost every message and severely limits throughput (see the
+        # RabbitMQ consumer prefetch guide). A maximum queue size of 0 means
+        # infinite, so the pre-fetch count is left unlimited (0) as well.
         prefetch_count = round(self.publishing_queue.maxsize / 5)
+        if self.publishing_queue.maxsize > 0:
+            prefetch_count = max(MIN_PREFETCH_COUNT, prefetch_count)
         self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
 
+        # Acknowledge consumed messages in batches of a quarter of the pre-fetch
+        # window. Delivery tags are bound to the channel, therefore any pending
+        # acknowledgements and timed flush from a previous channel are
+        # discarded.
+        self._ack_batch_size = max(
+            1, (prefetch_count or MIN_PREFETCH_COUNT) // 4)
+        self._no_of_unacked_messages = 0
+        self._last_unacked_delivery_tag = 0
+        self._cancel_ack_flush_timer()
+
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
         self.rabbitmq.confirm_delivery()
@@ -75,125 +104,198 @@ class GithubAlerter(Alerter):
         if github_id not in self._api_call_error:
             self._api_call_error[github_id] = False
 
+    def _acknowledge(self, delivery_tag: int) -> None:
+        # Record the message as processed, and acknowledge all the messages
+        # received up to this delivery tag at once when the batch is full. The
+        # first message of a batch schedules a flush so that messages are not
+        # left unacknowledged for long when the rate of messages is low.
+        self._last_unacked_delivery_tag = delivery_tag
+        self._no_of_unacked_messages += 1
+        if self._no_of_unacked_messages >= self._ack_batch_size:
+            self._flush_acks()
+        elif self._no_of_unacked_messages == 1:
+            # Keep the connection which the timer is created on, as the
+            # RabbitMQ connection may be replaced before the timer fires.
+            self._ack_flush_connection = self.rabbitmq.connection
+            self._ack_flush_timer = self._ack_flush_connection.call_later(
+                ACK_BATCH_FLUSH_INTERVAL_SECONDS, self._on_ack_flush_timeout)
+
+    def _on_ack_flush_timeout(self) -> None:
+        # The timer has fired, therefore there is nothing left to cancel
+        self._ack_flush_timer = None
+        self._ack_flush_connection = None
+        self._flush_acks()
+
+    def _cancel_ack_flush_timer(self) -> None:
+        # A timer is removed from the connection it was created on. If that
+        # connection has been closed the timer can never fire, so there is
+        # nothing to remove.
+        if self._ack_flush_timer is None:
+            return
+
+        if self._ack_flush_connection.is_open:
+            self._ack_flush_connection.remove_timeout(self._ack_flush_timer)
+        self._ack_flush_timer = None
+        self._ack_flush_connection = None
+
+    def _flush_acks(self) -> None:
+        # Cancel the timed flush of this batch, otherwise it would flush the
+        # next batch early.
+        self._cancel_ack_flush_timer()
+        if self._no_of_unacked_messages == 0:
+            return
+
+        self.rabbitmq.basic_ack(self._last_unacked_delivery_tag, True)
+        self.logger.debug("Acknowledged %s messages up to delivery tag %s",
+                          self._no_of_unacked_messages,
+                          self._last_unacked_delivery_tag)
+        self._no_of_unacked_messages = 0
+
+    def _process_result(self, result: Dict,
+                        data_for_alerting: List) -> None:
+        meta = result['meta_data']
+        data = result['data']
+
+        # Extract only the fields needed for classification once
+        repo_id = meta['repo_id']
+        repo_name = meta['repo_name']
+        repo_parent_id = meta['repo_parent_id']
+        last_monitored = meta['last_monitored']
+
+        self._create_state_for_github(repo_id)
+
+        # The number of releases is normalised to int once, previous is None on
+        # the first monitoring round of a repo.
+        no_of_releases = data['no_of_releases']
+        current = int(no_of_releases['current'])
+        previous = no_of_releases['previous']
+        if previous is not None:
+            previous = int(previous)
+        no_of_new_releases = current - previous \
+            if previous is not None and current > previous else 0
+
+        # Most monitoring rounds bring no new releases and resolve no errors,
+        # therefore there is nothing to classify.
+        if (no_of_new_releases == 0
+                and not self._cannot_access_github_page[repo_id]
+                and not self._api_call_error[repo_id]):
+            return
+
+        if self._cannot_access_github_page[repo_id]:
+            alert = GitHubPageNowAccessibleAlert(
+                repo_name, Severity.INFO.value, last_monitored, repo_parent_id,
+                repo_id)
+            self._cannot_access_github_page[repo_id] = False
+            alert_data = alert.alert_data
+            data_for_alerting.append(alert_data)
+            self.logger.debug("Successfully classified alert %s", alert_data)
+
+        if self._api_call_error[repo_id]:
+            alert = GitHubAPICallErrorResolvedAlert(
+                repo_name, Severity.INFO.value, last_monitored, repo_parent_id,
+                repo_id)
+            self._api_call_error[repo_id] = False
+            alert_data = alert.alert_data
+            data_for_alerting.append(alert_data)
+            self.logger.debug("Successfully classified alert %s", alert_data)
+
+        if no_of_new_releases > 0:
+            releases = data['releases']
+            # Index 0 is the latest release, thus first raise alerts for old
+            # releases.
+            for index in range(no_of_new_releases - 1, -1, -1):
+                release = releases[str(index)]
+                alert = NewGitHubReleaseAlert(
+                    repo_name, release['release_name'], release['tag_name'],
+                    Severity.INFO.value, last_monitored, repo_parent_id,
+                    repo_id)
+                alert_data = alert.alert_data
+                data_for_alerting.append(alert_data)
+                self.logger.debug("Successfully classified alert %s",
+                                  alert_data)
+
+    def _process_error(self, error: Dict, data_for_alerting: List) -> None:
+        """
+        CannotAccessGithubPageAlert and GitHubAPICallErrorAlert repeats
+        constantly on each monitoring round (DEFAULT: 1 hour). This has
+        repeat timer as it's an indication that the configuration is
+        wrong and should be fixed.
+        """
+        error_code = int(error['code'])
+        error_message = error['message']
+        meta_data = error['meta_data']
+
+        # Extract only the fields needed for classification once
+        repo_id = meta_data['repo_id']
+        repo_name = meta_data['repo_name']
+        repo_parent_id = meta_data['repo_parent_id']
+        time = meta_data['time']
+
+        self._create_state_for_github(repo_id)
+
+        # Check for error code match. If not, check if error has been
+        # resolved.
+        if error_code == CannotAccessGitHubPageException.code:
+            alert = CannotAccessGitHubPageAlert(
+                repo_name, Severity.ERROR.value, time, repo_parent_id, repo_id)
+            alert_data = alert.alert_data
+            data_for_alerting.append(alert_data)
+            self.logger.debug("Successfully classified alert %s", alert_data)
+            self._cannot_access_github_page[repo_id] = True
+        elif self._cannot_access_github_page[repo_id]:
+            alert = GitHubPageNowAccessibleAlert(
+                repo_name, Severity.INFO.value, time, repo_parent_id, repo_id)
+            self._cannot_access_github_page[repo_id] = False
+            alert_data = alert.alert_data
+            data_for_alerting.append(alert_data)
+            self.logger.debug("Successfully classified alert %s", alert_data)
+
+        if error_code == GitHubAPICallException.code:
+            alert = GitHubAPICallErrorAlert(
+                repo_name, Severity.ERROR.value, time, repo_parent_id, repo_id,
+                error_message)
+            alert_data = alert.alert_data
+            data_for_alerting.append(alert_data)
+            self.logger.debug("Successfully classified alert %s", alert_data)
+            self._api_call_error[repo_id] = True
+        elif self._api_call_error[repo_id]:
+            alert = GitHubAPICallErrorResolvedAlert(
+                repo_name, Severity.INFO.value, time, repo_parent_id, repo_id)
+            self._api_call_error[repo_id] = False
+            alert_data = alert.alert_data
+            data_for_alerting.append(alert_data)
+            self.logger.debug("Successfully classified alert %s", alert_data)
+
     def _process_data(self,
                       ch: pika.adapters.blocking_connection.BlockingChannel,
                       method: pika.spec.Basic.Deliver,
                       properties: pika.spec.BasicProperties,
                       body: bytes) -> None:
-        data_received = json.loads(body)
+        data_received = orjson.loads(body)
         self.logger.debug("Received %s. Now processing this data.",
                           data_received)
 
         processing_error = False
         data_for_alerting = []
         try:
-            if 'result' in data_received:
-                meta = data_received['result']['meta_data']
-                data = data_received['result']['data']
-
-                self._create_state_for_github(meta['repo_id'])
-
-                if self._cannot_access_github_page[meta['repo_id']]:
-                    alert = GitHubPageNowAccessibleAlert(
-                        meta['repo_name'], Severity.INFO.value,
-                        meta['last_monitored'], meta['repo_parent_id'],
-                        meta['repo_id'])
-                    self._cannot_access_github_page[meta['repo_id']] = False
-                    data_for_alerting.append(alert.alert_data)
-                    self.logger.debug("Successfully classified alert %s",
-                                      alert.alert_data)
-
-                if self._api_call_error[meta['repo_id']]:
-                    alert = GitHubAPICallErrorResolvedAlert(
-                        meta['repo_name'], Severity.INFO.value,
-                        meta['last_monitored'], meta['repo_parent_id'],
-                        meta['repo_id'])
-                    self._api_call_error[meta['repo_id']] = False
-                    data_for_alerting.append(alert.alert_data)
-                    self.logger.debug("Successfully classified alert %s",
-                                      alert.alert_data)
-
-                current = data['no_of_releases']['current']
-                previous = data['no_of_releases']['previous']
-                if previous is not None and int(current) > int(previous):
-                    no_of_new_releases = int(current) - int(previous)
-                    for i in range(0, no_of_new_releases):
-                        # Index 0 is the latest release, thus first raise alerts
-                        # for old releases.
-                        alert = NewGitHubReleaseAlert(
-                            meta['repo_name'],
-                            data['releases'][str(no_of_new_releases - i - 1)][
-                                'release_name'],
-                            data['releases'][str(no_of_new_releases - i - 1)][
-                                'tag_name'], Severity.INFO.value,
-                            meta['last_monitored'], meta['repo_parent_id'],
-                            meta['repo_id']
-                        )
-                        data_for_alerting.append(alert.alert_data)
-                        self.logger.debug("Successfully classified alert %s",
-                                          alert.alert_data)
-            elif 'error' in data_received:
-                """
-                CannotAccessGithubPageAlert and GitHubAPICallErrorAlert repeats 
-                constantly on each monitoring round (DEFAULT: 1 hour). This has 
-                repeat timer as it's an indication that the configuration is 
-                wrong and should be fixed.
-                """
-                error_code = int(data_received['error']['code'])
-                error_message = data_received['error']['message']
-                meta_data = data_received['error']['meta_data']
-
-                self._create_state_for_github(meta_data['repo_id'])
-
-                # Check for error code match. If not, check if error has been
-                # resolved.
-                if error_code == CannotAccessGitHubPageException.code:
-                    alert = CannotAccessGitHubPageAlert(
-                        meta_data['repo_name'], Severity.ERROR.value,
-                        meta_data['time'], meta_data['repo_parent_id'],
-                        meta_data['repo_id']
-                    )
-                    data_for_alerting.append(alert.alert_data)
-                    self.logger.debug("Successfully classified alert %s",
-                                      alert.alert_data)
-                    self._cannot_access_github_page[meta_data[
-                        'repo_id']] = True
-                elif self._cannot_access_github_page[meta_data['repo_id']]:
-                    alert = GitHubPageNowAccessibleAlert(
-                        meta_data['repo_name'], Severity.INFO.value,
-                        meta_data['last_monitored'],
-                        meta_data['repo_parent_id'],
-                        meta_data['repo_id'])
-                    self._cannot_access_github_page[meta_data[
-                        'repo_id']] = False
-                    data_for_alerting.append(alert.alert_data)
-                    self.logger.debug("Successfully classified alert %s",
-                                      alert.alert_data)
-
-                if error_code == GitHubAPICallException.code:
-                    alert = GitHubAPICallErrorAlert(
-                        meta_data['repo_name'], Severity.ERROR.value,
-                        meta_data['time'], meta_data['repo_parent_id'],
-                        meta_data['repo_id'], error_message
-                    )
-                    data_for_alerting.append(alert.alert_data)
-                    self.logger.debug("Successfully classified alert %s",
-                                      alert.alert_data)
-                    self._api_call_error[meta_data['repo_id']] = True
-                elif self._api_call_error[meta_data['repo_id']]:
-                    alert = GitHubAPICallErrorResolvedAlert(
-                        meta_data['repo_name'], Severity.INFO.value,
-                        meta_data['time'],
-                        meta_data['repo_parent_id'],
-                        meta_data['repo_id'])
-                    self._api_call_error[meta_data[
-                        'repo_id']] = False
-                    data_for_alerting.append(alert.alert_data)
-                    self.logger.debug("Successfully classified alert %s",
-                                      alert.alert_data)
+            # Check the shape of the data first, so that unexpected data is
+            # reported without going through exception handling.
+            is_dict = isinstance(data_received, dict)
+            if is_dict and 'result' in data_received:
+                self._process_result(data_received['result'],
+                                     data_for_alerting)
+            elif is_dict and 'error' in data_received:
+                self._process_error(data_received['error'], data_for_alerting)
             else:
-                raise ReceivedUnexpectedDataException("{}: _process_data"
-                                                      "".format(self))
+                self.logger.error("Error when processing %s: received "
+                                  "unexpected data", data_received)
+                processing_error = True
+        except (KeyError, TypeError, ValueError) as e:
+            # The data is missing fields or has fields of the wrong type. The
+            # traceback adds nothing in this case and is expensive to format,
+            # therefore only the error is logged.
+            self.logger.error("Error when processing %s: %r", data_received, e)
+            processing_error = True
         except Exception as e:
             self.logger.error("Error when processing %s", data_received)
             self.logger.exception(e)
@@ -203,12 +305,10 @@ class GithubAlerter(Alerter):
         if len(data_for_alerting) != 0:
             self._place_latest_data_on_queue(data_for_alerting)
 
-        # If the data is processed, it can be acknowledged.
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
-
         # Send any data waiting in the publisher queue, if any
         try:
-            self._send_data()
+            if not self.publishing_queue.empty():
+                self._send_data()
 
             if not processing_error:
                 heartbeat = {
@@ -225,18 +325,44 @@ class GithubAlerter(Alerter):
             # For any other exception raise it
             raise e
 
+        # The data is acknowledged only after the alerts derived from it have
+        # been confirmed by RabbitMQ, or are residing in the publisher queue.
+        self._acknowledge(method.delivery_tag)
+
     def _place_latest_data_on_queue(self, data_list: List) -> None:
         # Place the latest alert data on the publishing queue. If the
-        # queue is full, remove old data.
+        # queue is full, remove old data. The alert data is serialized once
+        # here, as it is freshly built by the alert and never mutated, so that
+        # it is not copied and can be published as is.
+        publishing_queue = self.publishing_queue
+        if publishing_queue.maxsize > 0:
+            # Make room for the whole batch at once rather than checking
+            # whether the queue is full before every put. Only the latest
+            # maxsize alerts can fit in the queue.
+            data_list = data_list[-publishing_queue.maxsize:]
+            no_of_items_to_remove = (publishing_queue.qsize() + len(data_list)
+                                     - publishing_queue.maxsize)
+            for _ in range(no_of_items_to_remove):
+                publishing_queue.get_nowait()
+
         for alert in data_list:
             self.logger.debug("Adding %s to the publishing queue.", alert)
-            if self.publishing_queue.full():
-                self.publishing_queue.get()
-            self.publishing_queue.put({
+            publishing_queue.put_nowait({
                 'exchange': ALERT_EXCHANGE,
                 'routing_key': GITHUB_ALERT_ROUTING_KEY,
-                'data': copy.deepcopy(alert),
-                'properties': pika.BasicProperties(delivery_mode=2),
+                'data': orjson.dumps(alert),
+                'is_body_dict': False,
+                'properties': PERSISTENT_DELIVERY_PROPERTIES,
                 'mandatory': True})
             self.logger.debug("%s added to the publishing queue successfully.",
                               alert)
+
+    def _on_terminate(self, signum: int, stack: FrameType) -> None:
+        # Acknowledge the messages pending in the current batch, otherwise they
+        # would be re-delivered and re-alerted on when the alerter restarts.
+        try:
+            self._flush_acks()
+        except Exception as e:
+            self.logger.exception(e)
+
+        super()._on_terminate(signum, stack)
@@ -5,6 +5,9 @@ from src.alerter.grouped_alerts_metric_code import GroupedAlertsMetricCode
 
 
 class Alert:
+    __slots__ = ('_alert_code', '_message', '_severity', '_parent_id',
+                 '_origin_id', '_timestamp', '_alert_group_metric_code',
+                 '_metric_state_args', '_alert_data')
 
     def __init__(
             self, alert_code: AlertCode, message: str, severity: str,
@@ -19,6 +22,7 @@ class Alert:
         self._timestamp = timestamp
         self._alert_group_metric_code = alert_group_metric_code
         self._metric_state_args = metric_state_args
+        self._alert_data = None
 
     def __str__(self) -> str:
         return self.message
@@ -57,6 +61,14 @@ class Alert:
 
     @property
     def alert_data(self) -> Dict:
+        # An alert cannot be modified once created, therefore the alert data is
+        # built on first access and the same dict is returned afterwards.
+        if self._alert_data is None:
+            self._alert_data = self._build_alert_data()
+
+        return self._alert_data
+
+    def _build_alert_data(self) -> Dict:
         return {
             'alert_code': {
                 'name': self._alert_code.name,
@@ -4,6 +4,8 @@ from src.alerter.grouped_alerts_metric_code import GroupedGithubAlertsMetricCode
 
 
 class NewGitHubReleaseAlert(Alert):
+    __slots__ = ()
+
     def __init__(self, origin_name: str, release_name: str, tag_name: str,
                  severity: str, timestamp: float, parent_id: str,
                  origin_id: str) -> None:
@@ -16,6 +18,8 @@ class NewGitHubReleaseAlert(Alert):
 
 
 class CannotAccessGitHubPageAlert(Alert):
+    __slots__ = ()
+
     def __init__(self, origin_name: str, severity: str, timestamp: float,
                  parent_id: str, origin_id: str) -> None:
         super().__init__(
@@ -26,6 +30,8 @@ class CannotAccessGitHubPageAlert(Alert):
 
 
 class GitHubPageNowAccessibleAlert(Alert):
+    __slots__ = ()
+
     def __init__(self, origin_name: str, severity: str, timestamp: float,
                  parent_id: str, origin_id: str) -> None:
         super().__init__(
@@ -36,6 +42,8 @@ class GitHubPageNowAccessibleAlert(Alert):
 
 
 class GitHubAPICallErrorAlert(Alert):
+    __slots__ = ()
+
     def __init__(self, origin_name: str, severity: str, timestamp: float,
                  parent_id: str, origin_id: str, error_msg: str) -> None:
         super().__init__(
@@ -46,6 +54,8 @@ class GitHubAPICallErrorAlert(Alert):
 
 
 class GitHubAPICallErrorResolvedAlert(Alert):
+    __slots__ = ()
+
     def __init__(self, origin_name: str, severity: str, timestamp: float,
                  parent_id: str, origin_id: str) -> None:
         super().__init__(
@@ -165,3 +165,7 @@ GH_MON_MAN_CONFIGS_ROUTING_KEY_GEN = 'general.github_repos_config'
 DH_MON_MAN_CONFIGS_ROUTING_KEY_GEN = 'general.dockerhub_repos_config'
 SYS_MON_MAN_CONFIGS_ROUTING_KEY_GEN = 'general.systems_config'
 ALERTS_CONFIGS_ROUTING_KEY_GEN = 'general.alerts_config'
+
+# Consumer configuration
+MIN_PREFETCH_COUNT = 100
+ACK_BATCH_FLUSH_INTERVAL_SECONDS = 1
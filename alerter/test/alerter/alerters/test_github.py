@@ -14,13 +14,15 @@ from parameterized import parameterized
 from src.alerter.alerters.github import GithubAlerter
 from src.alerter.alerts.github_alerts import NewGitHubReleaseAlert
 from src.message_broker.rabbitmq import RabbitMQApi
-from src.utils.constants.rabbitmq import (ALERT_EXCHANGE,
+from src.utils.constants.rabbitmq import (ACK_BATCH_FLUSH_INTERVAL_SECONDS,
+                                          ALERT_EXCHANGE,
                                           GITHUB_ALERTER_INPUT_QUEUE_NAME,
                                           GITHUB_ALERT_ROUTING_KEY,
                                           HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY,
                                           GITHUB_TRANSFORMED_DATA_ROUTING_KEY,
                                           HEALTH_CHECK_EXCHANGE, TOPIC)
 from src.utils.env import ALERTER_PUBLISHING_QUEUE_SIZE, RABBIT_IP
+from src.utils.exceptions import MessageWasNotDeliveredException
 
 
 class TestGithubAlerter(unittest.TestCase):
@@ -442,41 +444,73 @@ class TestGithubAlerter(unittest.TestCase):
         except Exception as e:
             self.fail("Test failed: {}".format(e))
 
+    @parameterized.expand([
+        ("unknown",), ([1, 2],), (None,), (5,), ({},),
+        ({'unknown': {}},),
+    ])
     @mock.patch(
         "src.alerter.alerters.alerter.RabbitMQApi.basic_publish_confirm",
         autospec=True)
     @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.basic_ack",
                 autospec=True)
-    @mock.patch("src.alerter.alerters.github.ReceivedUnexpectedDataException",
-                autospec=True)
     def test_received_unexpected_data_error(
-            self, mock_received_unexpected_data_error, mock_ack,
-            mock_basic_publish_confirm):
-        self.rabbitmq.connect()
-        self.rabbitmq.exchange_declare(ALERT_EXCHANGE, "topic", False, True,
-                                       False, False)
-
-        mock_ack.return_value = self.none
-        try:
-            self.test_github_alerter._initialise_rabbitmq()
-            blocking_channel = self.test_github_alerter.rabbitmq.channel
-
-            method_chains = pika.spec.Basic.Deliver(
-                routing_key=GITHUB_TRANSFORMED_DATA_ROUTING_KEY)
-
-            properties = pika.spec.BasicProperties()
-            github_data_error = "unknown"
+            self, data_received, mock_ack,
+            mock_basic_publish_confirm) -> None:
+        method_chains = pika.spec.Basic.Deliver(
+            delivery_tag=1, routing_key=GITHUB_TRANSFORMED_DATA_ROUTING_KEY)
+
+        with mock.patch.object(self.dummy_logger, 'error') as mock_error, \
+                mock.patch.object(self.dummy_logger,
+                                  'exception') as mock_exception:
             self.test_github_alerter._process_data(
-                blocking_channel,
-                method_chains,
-                properties,
-                json.dumps(github_data_error)
-            )
+                None, method_chains, pika.spec.BasicProperties(),
+                json.dumps(data_received))
+
+            mock_error.assert_called_once_with(
+                "Error when processing %s: received unexpected data",
+                data_received)
+            mock_exception.assert_not_called()
+
+        # No heartbeat is sent, but the message is still acknowledged
+        self.assertEqual(0, mock_basic_publish_confirm.call_count)
+        mock_ack.assert_called_once_with(
+            self.test_github_alerter.rabbitmq, 1, True)
+
+    @parameterized.expand([
+        ({'result': {'meta_data': {}, 'data': {}}}, KeyError),
+        ({'result': {'meta_data': [], 'data': {}}}, TypeError),
+        ({'error': {'code': 'not a number', 'message': '',
+                    'meta_data': {}}}, ValueError),
+    ])
+    @mock.patch(
+        "src.alerter.alerters.alerter.RabbitMQApi.basic_publish_confirm",
+        autospec=True)
+    @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.basic_ack",
+                autospec=True)
+    def test_malformed_data_is_logged_without_traceback(
+            self, data_received, expected_error, mock_ack,
+            mock_basic_publish_confirm) -> None:
+        method_chains = pika.spec.Basic.Deliver(
+            delivery_tag=1, routing_key=GITHUB_TRANSFORMED_DATA_ROUTING_KEY)
+
+        with mock.patch.object(self.dummy_logger, 'error') as mock_error, \
+                mock.patch.object(self.dummy_logger,
+                                  'exception') as mock_exception:
+            self.test_github_alerter._process_data(
+                None, method_chains, pika.spec.BasicProperties(),
+                json.dumps(data_received))
 
-            mock_received_unexpected_data_error.assert_called_once()
-            self.assertEqual(0, mock_basic_publish_confirm.call_count)
-        except Exception as e:
-            self.fail("Test failed: {}".format(e))
+            mock_error.assert_called_once()
+            args, _ = mock_error.call_args
+            self.assertEqual("Error when processing %s: %r", args[0])
+            self.assertEqual(data_received, args[1])
+            self.assertIsInstance(args[2], expected_error)
+            mock_exception.assert_not_called()
+
+        # No heartbeat is sent, but the message is still acknowledged
+        self.assertEqual(0, mock_basic_publish_confirm.call_count)
+        mock_ack.assert_called_once_with(
+            self.test_github_alerter.rabbitmq, 1, True)
 
     # Same test that is in monitors tests
     def test_send_heartbeat_sends_a_heartbeat_correctly(self) -> None:
@@ -581,6 +615,72 @@ class TestGithubAlerter(unittest.TestCase):
         except Exception as e:
             self.fail("Test failed: {}".format(e))
 
+    def test_place_latest_data_on_queue_places_serialized_alert_data(
+            self) -> None:
+        self.test_github_alerter._place_latest_data_on_queue(
+            [self.alert.alert_data])
+
+        self.assertEqual(1, self.test_github_alerter.publishing_queue.qsize())
+        queued_data = self.test_github_alerter.publishing_queue.queue[0]
+        self.assertEqual(ALERT_EXCHANGE, queued_data['exchange'])
+        self.assertEqual(self.output_routing_key, queued_data['routing_key'])
+        self.assertIsInstance(queued_data['data'], bytes)
+        self.assertEqual(self.alert.alert_data, json.loads(queued_data['data']))
+        self.assertFalse(queued_data['is_body_dict'])
+        self.assertTrue(queued_data['mandatory'])
+
+    def test_place_latest_data_on_queue_removes_oldest_data_if_queue_full(
+            self) -> None:
+        self.test_github_alerter = GithubAlerter(
+            self.alerter_name, self.dummy_logger, self.rabbitmq, 2)
+        alerts = [{'alert_no': alert_no} for alert_no in range(3)]
+
+        self.test_github_alerter._place_latest_data_on_queue(alerts[:1])
+        self.test_github_alerter._place_latest_data_on_queue(alerts[1:])
+
+        queued_data = [
+            json.loads(data['data'])
+            for data in self.test_github_alerter.publishing_queue.queue
+        ]
+        self.assertEqual(alerts[1:], queued_data)
+
+        self.test_github_alerter._place_latest_data_on_queue(alerts)
+
+        queued_data = [
+            json.loads(data['data'])
+            for data in self.test_github_alerter.publishing_queue.queue
+        ]
+        self.assertEqual(alerts[1:], queued_data)
+
+    @mock.patch(
+        "src.alerter.alerters.alerter.RabbitMQApi.basic_publish_confirm",
+        autospec=True)
+    def test_send_data_publishes_serialized_and_dict_data_correctly(
+            self, mock_basic_publish_confirm) -> None:
+        self.test_github_alerter._place_latest_data_on_queue(
+            [self.alert.alert_data])
+        # Data queued through the shared component has no 'is_body_dict' key
+        self.test_github_alerter._push_to_queue(
+            self.heartbeat_test, HEALTH_CHECK_EXCHANGE,
+            HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY)
+
+        self.test_github_alerter._send_data()
+
+        self.assertEqual(2, mock_basic_publish_confirm.call_count)
+        _, github_kwargs = mock_basic_publish_confirm.call_args_list[0]
+        self.assertEqual(GITHUB_ALERT_ROUTING_KEY,
+                         github_kwargs['routing_key'])
+        self.assertIsInstance(github_kwargs['body'], bytes)
+        self.assertEqual(self.alert.alert_data,
+                         json.loads(github_kwargs['body']))
+        self.assertFalse(github_kwargs['is_body_dict'])
+        _, heartbeat_kwargs = mock_basic_publish_confirm.call_args_list[1]
+        self.assertEqual(HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY,
+                         heartbeat_kwargs['routing_key'])
+        self.assertEqual(self.heartbeat_test, heartbeat_kwargs['body'])
+        self.assertTrue(heartbeat_kwargs['is_body_dict'])
+        self.assertTrue(self.test_github_alerter.publishing_queue.empty())
+
     @mock.patch(
         "src.alerter.alerters.alerter.RabbitMQApi.basic_publish_confirm",
         autospec=True)
@@ -600,3 +700,415 @@ class TestGithubAlerter(unittest.TestCase):
             mock_basic_publish_confirm.assert_called_once()
         except Exception as e:
             self.fail("Test failed: {}".format(e))
+
+    @mock.patch(
+        "src.alerter.alerters.alerter.RabbitMQApi.basic_publish_confirm",
+        autospec=True)
+    @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.basic_ack",
+                autospec=True)
+    def test_process_data_acknowledges_messages_in_batches(
+            self, mock_ack, mock_basic_publish_confirm):
+        self.rabbitmq.connect()
+        self.rabbitmq.exchange_declare(ALERT_EXCHANGE, "topic", False, True,
+                                       False, False)
+
+        mock_ack.return_value = self.none
+        try:
+            self.test_github_alerter._initialise_rabbitmq()
+            self.test_github_alerter._ack_batch_size = 2
+            blocking_channel = self.test_github_alerter.rabbitmq.channel
+            properties = pika.spec.BasicProperties()
+
+            method_1 = pika.spec.Basic.Deliver(
+                delivery_tag=1, routing_key=GITHUB_TRANSFORMED_DATA_ROUTING_KEY)
+            self.test_github_alerter._process_data(
+                blocking_channel, method_1, properties, self.github_json)
+            mock_ack.assert_not_called()
+
+            method_2 = pika.spec.Basic.Deliver(
+                delivery_tag=2, routing_key=GITHUB_TRANSFORMED_DATA_ROUTING_KEY)
+            self.test_github_alerter._process_data(
+                blocking_channel, method_2, properties, self.github_json)
+            mock_ack.assert_called_once_with(
+                self.test_github_alerter.rabbitmq, 2, True)
+            self.assertEqual(
+                0, self.test_github_alerter._no_of_unacked_messages)
+        except Exception as e:
+            self.fail("Test failed: {}".format(e))
+
+    @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.connection",
+                new_callable=mock.PropertyMock)
+    @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.basic_ack",
+                autospec=True)
+    def test_acknowledge_flushes_partial_batch_when_timer_fires(
+            self, mock_ack, mock_connection) -> None:
+        connection = mock_connection.return_value
+        self.test_github_alerter._ack_batch_size = 3
+
+        self.test_github_alerter._acknowledge(1)
+        self.test_github_alerter._acknowledge(2)
+
+        connection.call_later.assert_called_once_with(
+            ACK_BATCH_FLUSH_INTERVAL_SECONDS,
+            self.test_github_alerter._on_ack_flush_timeout)
+        mock_ack.assert_not_called()
+
+        # Fire the timer
+        connection.call_later.call_args[0][1]()
+
+        mock_ack.assert_called_once_with(
+            self.test_github_alerter.rabbitmq, 2, True)
+        connection.remove_timeout.assert_not_called()
+        self.assertIsNone(self.test_github_alerter._ack_flush_timer)
+        self.assertEqual(0, self.test_github_alerter._no_of_unacked_messages)
+
+    @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.connection",
+                new_callable=mock.PropertyMock)
+    @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.basic_ack",
+                autospec=True)
+    def test_acknowledge_cancels_timer_when_batch_is_full(
+            self, mock_ack, mock_connection) -> None:
+        connection = mock_connection.return_value
+        connection.call_later.side_effect = ['timer_1', 'timer_2']
+        self.test_github_alerter._ack_batch_size = 2
+
+        self.test_github_alerter._acknowledge(1)
+        self.test_github_alerter._acknowledge(2)
+
+        mock_ack.assert_called_once_with(
+            self.test_github_alerter.rabbitmq, 2, True)
+        connection.remove_timeout.assert_called_once_with('timer_1')
+        self.assertIsNone(self.test_github_alerter._ack_flush_timer)
+
+        # The next batch gets a timer of its own
+        self.test_github_alerter._acknowledge(3)
+
+        self.assertEqual(2, connection.call_later.call_count)
+        self.assertEqual('timer_2', self.test_github_alerter._ack_flush_timer)
+        self.assertEqual(1, mock_ack.call_count)
+
+    @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.connection",
+                new_callable=mock.PropertyMock)
+    @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.basic_ack",
+                autospec=True)
+    @mock.patch(
+        "src.alerter.alerters.github.GithubAlerter.disconnect_from_rabbit",
+        autospec=True)
+    def test_on_terminate_flushes_pending_acks(
+            self, mock_disconnect, mock_ack, mock_connection) -> None:
+        connection = mock_connection.return_value
+        connection.call_later.return_value = 'timer'
+        self.test_github_alerter._ack_batch_size = 3
+        self.test_github_alerter._acknowledge(1)
+        self.test_github_alerter._acknowledge(2)
+
+        self.assertRaises(SystemExit, self.test_github_alerter._on_terminate,
+                          None, None)
+
+        mock_ack.assert_called_once_with(
+            self.test_github_alerter.rabbitmq, 2, True)
+        connection.remove_timeout.assert_called_once_with('timer')
+        mock_disconnect.assert_called_once()
+        self.assertEqual(0, self.test_github_alerter._no_of_unacked_messages)
+
+    @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.basic_ack",
+                autospec=True)
+    def test_initialise_rabbit_discards_pending_acks(self, mock_ack) -> None:
+        try:
+            self.test_github_alerter._initialise_rabbitmq()
+            self.test_github_alerter._acknowledge(1)
+            self.assertEqual(
+                1, self.test_github_alerter._no_of_unacked_messages)
+            self.assertIsNotNone(self.test_github_alerter._ack_flush_timer)
+
+            self.test_github_alerter._initialise_rabbitmq()
+
+            self.assertEqual(
+                0, self.test_github_alerter._no_of_unacked_messages)
+            self.assertEqual(
+                0, self.test_github_alerter._last_unacked_delivery_tag)
+            self.assertIsNone(self.test_github_alerter._ack_flush_timer)
+            mock_ack.assert_not_called()
+        except Exception as e:
+            self.fail("Test failed: {}".format(e))
+
+    @parameterized.expand([
+        (5, 100, 25),
+        (0, 0, 25),
+        (1000, 200, 50),
+        (2002, 400, 100),
+    ])
+    @mock.patch.object(RabbitMQApi, "confirm_delivery")
+    @mock.patch.object(RabbitMQApi, "basic_qos")
+    @mock.patch.object(RabbitMQApi, "basic_consume")
+    @mock.patch.object(RabbitMQApi, "queue_bind")
+    @mock.patch.object(RabbitMQApi, "queue_declare")
+    @mock.patch.object(RabbitMQApi, "exchange_declare")
+    @mock.patch.object(RabbitMQApi, "connect_till_successful")
+    def test_initialise_rabbit_sets_prefetch_count_and_ack_batch_size(
+            self, max_queue_size, expected_prefetch_count,
+            expected_ack_batch_size, mock_connect, mock_exchange_declare,
+            mock_queue_declare, mock_queue_bind, mock_basic_consume,
+            mock_basic_qos, mock_confirm_delivery) -> None:
+        github_alerter = GithubAlerter(self.alerter_name, self.dummy_logger,
+                                       self.rabbitmq, max_queue_size)
+
+        github_alerter._initialise_rabbitmq()
+
+        mock_basic_qos.assert_called_once_with(
+            prefetch_count=expected_prefetch_count)
+        self.assertEqual(expected_ack_batch_size,
+                         github_alerter._ack_batch_size)
+
+    @mock.patch(
+        "src.alerter.alerters.alerter.RabbitMQApi.basic_publish_confirm",
+        autospec=True)
+    @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.basic_ack",
+                autospec=True)
+    @mock.patch("src.alerter.alerters.github.GitHubPageNowAccessibleAlert",
+                autospec=True)
+    def test_error_with_other_code_resolves_cannot_access_github_page(
+            self, mock_github_access, mock_ack,
+            mock_basic_publish_confirm) -> None:
+        type(mock_github_access.return_value).alert_data = \
+            mock.PropertyMock(return_value={})
+        method_chains = pika.spec.Basic.Deliver(
+            routing_key=GITHUB_TRANSFORMED_DATA_ROUTING_KEY)
+        properties = pika.spec.BasicProperties()
+
+        self.test_github_alerter._process_data(
+            None, method_chains, properties, self.github_json_error)
+        self.assertEqual({self.repo_id: True},
+                         self.test_github_alerter._cannot_access_github_page)
+        mock_github_access.assert_not_called()
+
+        self.test_github_alerter._process_data(
+            None, method_chains, properties,
+            json.dumps(self.github_api_error))
+
+        # Error data carries the time of the error, not a last_monitored
+        mock_github_access.assert_called_once_with(
+            self.repo_name, self.info, self.last_monitored, self.parent_id,
+            self.repo_id)
+        self.assertEqual({self.repo_id: False},
+                         self.test_github_alerter._cannot_access_github_page)
+
+    @mock.patch(
+        "src.alerter.alerters.alerter.RabbitMQApi.basic_publish_confirm",
+        autospec=True)
+    @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.basic_ack",
+                autospec=True)
+    @mock.patch("src.alerter.alerters.github.GitHubAPICallErrorResolvedAlert",
+                autospec=True)
+    @mock.patch("src.alerter.alerters.github.GitHubPageNowAccessibleAlert",
+                autospec=True)
+    @mock.patch("src.alerter.alerters.github.NewGitHubReleaseAlert",
+                autospec=True)
+    def test_no_new_releases_and_clean_state_classifies_no_alerts(
+            self, mock_new_github_release, mock_github_access,
+            mock_api_call_error_resolved, mock_ack,
+            mock_basic_publish_confirm) -> None:
+        self.github_data_received['result']['data']['no_of_releases'][
+            'previous'] = 5
+        method_chains = pika.spec.Basic.Deliver(
+            delivery_tag=1, routing_key=GITHUB_TRANSFORMED_DATA_ROUTING_KEY)
+
+        self.test_github_alerter._process_data(
+            None, method_chains, pika.spec.BasicProperties(),
+            json.dumps(self.github_data_received))
+
+        mock_new_github_release.assert_not_called()
+        mock_github_access.assert_not_called()
+        mock_api_call_error_resolved.assert_not_called()
+        # Only the heartbeat is published
+        self.assertEqual(1, mock_basic_publish_confirm.call_count)
+        self.assertTrue(self.test_github_alerter.publishing_queue.empty())
+        mock_ack.assert_called_once_with(
+            self.test_github_alerter.rabbitmq, 1, True)
+
+    @mock.patch(
+        "src.alerter.alerters.alerter.RabbitMQApi.basic_publish_confirm",
+        autospec=True)
+    @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.basic_ack",
+                autospec=True)
+    @mock.patch("src.alerter.alerters.github.GithubAlerter._send_data",
+                autospec=True)
+    def test_process_data_does_not_send_data_if_no_alerts_were_raised(
+            self, mock_send_data, mock_ack,
+            mock_basic_publish_confirm) -> None:
+        self.github_data_received['result']['data']['no_of_releases'][
+            'previous'] = 5
+        method_chains = pika.spec.Basic.Deliver(
+            delivery_tag=1, routing_key=GITHUB_TRANSFORMED_DATA_ROUTING_KEY)
+
+        self.test_github_alerter._process_data(
+            None, method_chains, pika.spec.BasicProperties(),
+            json.dumps(self.github_data_received))
+
+        mock_send_data.assert_not_called()
+        mock_basic_publish_confirm.assert_called_once()
+        _, kwargs = mock_basic_publish_confirm.call_args
+        self.assertEqual(HEALTH_CHECK_EXCHANGE, kwargs['exchange'])
+        mock_ack.assert_called_once_with(
+            self.test_github_alerter.rabbitmq, 1, True)
+
+    @parameterized.expand([
+        ('_cannot_access_github_page',
+         "src.alerter.alerters.github.GitHubPageNowAccessibleAlert"),
+        ('_api_call_error',
+         "src.alerter.alerters.github.GitHubAPICallErrorResolvedAlert"),
+    ])
+    @mock.patch(
+        "src.alerter.alerters.alerter.RabbitMQApi.basic_publish_confirm",
+        autospec=True)
+    @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.basic_ack",
+                autospec=True)
+    @mock.patch("src.alerter.alerters.github.NewGitHubReleaseAlert",
+                autospec=True)
+    def test_no_new_releases_still_resolves_errors(
+            self, state_attribute, resolved_alert, mock_new_github_release,
+            mock_ack, mock_basic_publish_confirm) -> None:
+        self.github_data_received['result']['data']['no_of_releases'][
+            'previous'] = 5
+        getattr(self.test_github_alerter, state_attribute)[self.repo_id] = True
+        method_chains = pika.spec.Basic.Deliver(
+            delivery_tag=1, routing_key=GITHUB_TRANSFORMED_DATA_ROUTING_KEY)
+
+        with mock.patch(resolved_alert, autospec=True) as mock_resolved_alert:
+            type(mock_resolved_alert.return_value).alert_data = \
+                mock.PropertyMock(return_value={})
+            self.test_github_alerter._process_data(
+                None, method_chains, pika.spec.BasicProperties(),
+                json.dumps(self.github_data_received))
+
+            mock_resolved_alert.assert_called_once_with(
+                self.repo_name, self.info, self.last_monitored,
+                self.parent_id, self.repo_id)
+
+        mock_new_github_release.assert_not_called()
+        self.assertEqual({self.repo_id: False},
+                         getattr(self.test_github_alerter, state_attribute))
+        # The resolved alert and the heartbeat are published
+        self.assertEqual(2, mock_basic_publish_confirm.call_count)
+        mock_ack.assert_called_once_with(
+            self.test_github_alerter.rabbitmq, 1, True)
+
+    @mock.patch(
+        "src.alerter.alerters.alerter.RabbitMQApi.basic_publish_confirm",
+        autospec=True)
+    @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.basic_ack",
+                autospec=True)
+    @mock.patch("src.alerter.alerters.github.GitHubPageNowAccessibleAlert",
+                autospec=True)
+    def test_malformed_no_of_releases_fails_before_resolving_errors(
+            self, mock_github_access, mock_ack,
+            mock_basic_publish_confirm) -> None:
+        self.github_data_received['result']['data']['no_of_releases'][
+            'current'] = 'not a number'
+        self.test_github_alerter._cannot_access_github_page[self.repo_id] = \
+            True
+        method_chains = pika.spec.Basic.Deliver(
+            delivery_tag=1, routing_key=GITHUB_TRANSFORMED_DATA_ROUTING_KEY)
+
+        self.test_github_alerter._process_data(
+            None, method_chains, pika.spec.BasicProperties(),
+            json.dumps(self.github_data_received))
+
+        mock_github_access.assert_not_called()
+        self.assertEqual({self.repo_id: True},
+                         self.test_github_alerter._cannot_access_github_page)
+        self.assertTrue(self.test_github_alerter.publishing_queue.empty())
+        # No heartbeat is sent as the data could not be processed
+        mock_basic_publish_confirm.assert_not_called()
+        mock_ack.assert_called_once_with(
+            self.test_github_alerter.rabbitmq, 1, True)
+
+    @parameterized.expand([
+        ("src.alerter.alerters.github.GithubAlerter._send_data",),
+        ("src.alerter.alerters.github.Alerter._send_heartbeat",),
+    ])
+    @mock.patch(
+        "src.alerter.alerters.alerter.RabbitMQApi.basic_publish_confirm",
+        autospec=True)
+    @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.basic_ack",
+                autospec=True)
+    def test_process_data_does_not_ack_if_publishing_raises_an_exception(
+            self, failing_function, mock_ack,
+            mock_basic_publish_confirm) -> None:
+        method_chains = pika.spec.Basic.Deliver(
+            delivery_tag=1, routing_key=GITHUB_TRANSFORMED_DATA_ROUTING_KEY)
+
+        with mock.patch(failing_function, autospec=True) as mock_failing:
+            mock_failing.side_effect = Exception('test')
+            self.assertRaises(
+                Exception, self.test_github_alerter._process_data, None,
+                method_chains, pika.spec.BasicProperties(), self.github_json)
+            mock_failing.assert_called_once()
+
+        mock_ack.assert_not_called()
+        self.assertEqual(0, self.test_github_alerter._no_of_unacked_messages)
+
+    @mock.patch(
+        "src.alerter.alerters.alerter.RabbitMQApi.basic_publish_confirm",
+        autospec=True)
+    @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.basic_ack",
+                autospec=True)
+    @mock.patch("src.alerter.alerters.github.GithubAlerter._send_data",
+                autospec=True)
+    def test_process_data_acks_if_message_was_not_delivered(
+            self, mock_send_data, mock_ack,
+            mock_basic_publish_confirm) -> None:
+        mock_send_data.side_effect = MessageWasNotDeliveredException('test')
+        method_chains = pika.spec.Basic.Deliver(
+            delivery_tag=1, routing_key=GITHUB_TRANSFORMED_DATA_ROUTING_KEY)
+
+        self.test_github_alerter._process_data(
+            None, method_chains, pika.spec.BasicProperties(), self.github_json)
+
+        mock_send_data.assert_called_once()
+        # The alert resides in the publishing queue to be sent later
+        self.assertEqual(1, self.test_github_alerter.publishing_queue.qsize())
+        mock_ack.assert_called_once_with(
+            self.test_github_alerter.rabbitmq, 1, True)
+
+    @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.connection",
+                new_callable=mock.PropertyMock)
+    @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.basic_ack",
+                autospec=True)
+    def test_flush_acks_removes_timer_only_from_connection_it_was_created_on(
+            self, mock_ack, mock_connection) -> None:
+        old_connection = mock.MagicMock()
+        old_connection.call_later.return_value = 'timer'
+        new_connection = mock.MagicMock()
+        mock_connection.return_value = old_connection
+        self.test_github_alerter._ack_batch_size = 3
+        self.test_github_alerter._acknowledge(1)
+
+        # The connection is replaced while the timer is pending
+        mock_connection.return_value = new_connection
+        self.test_github_alerter._flush_acks()
+
+        old_connection.remove_timeout.assert_called_once_with('timer')
+        new_connection.remove_timeout.assert_not_called()
+        self.assertIsNone(self.test_github_alerter._ack_flush_timer)
+        self.assertIsNone(self.test_github_alerter._ack_flush_connection)
+
+    @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.connection",
+                new_callable=mock.PropertyMock)
+    @mock.patch("src.alerter.alerters.alerter.RabbitMQApi.basic_ack",
+                autospec=True)
+    def test_flush_acks_does_not_remove_timer_from_closed_connection(
+            self, mock_ack, mock_connection) -> None:
+        connection = mock_connection.return_value
+        connection.call_later.return_value = 'timer'
+        self.test_github_alerter._ack_batch_size = 3
+        self.test_github_alerter._acknowledge(1)
+
+        connection.is_open = False
+        self.test_github_alerter._flush_acks()
+
+        connection.remove_timeout.assert_not_called()
+        self.assertIsNone(self.test_github_alerter._ack_flush_timer)
+        self.assertIsNone(self.test_github_alerter._ack_flush_connection)
+        mock_ack.assert_called_once_with(
+            self.test_github_alerter.rabbitmq, 1, True)
@@ -0,0 +1,66 @@
+import unittest
+
+from src.alerter.alert_code import GithubAlertCode, SystemAlertCode
+from src.alerter.alerts.github_alerts import NewGitHubReleaseAlert
+from src.alerter.alerts.system_alerts import SystemWentDownAtAlert
+from src.alerter.grouped_alerts_metric_code import (
+    GroupedGithubAlertsMetricCode, GroupedSystemAlertsMetricCode)
+
+
+class TestAlert(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_origin_name = 'test_origin_name'
+        self.test_severity = 'INFO'
+        self.test_timestamp = 1611619200.0
+        self.test_parent_id = 'test_parent_id'
+        self.test_origin_id = 'test_origin_id'
+        self.test_github_alert = NewGitHubReleaseAlert(
+            self.test_origin_name, 'test_release', 'v1.0.0',
+            self.test_severity, self.test_timestamp, self.test_parent_id,
+            self.test_origin_id)
+        self.test_system_alert = SystemWentDownAtAlert(
+            self.test_origin_name, self.test_severity, self.test_timestamp,
+            self.test_parent_id, self.test_origin_id)
+
+    def tearDown(self) -> None:
+        self.test_github_alert = None
+        self.test_system_alert = None
+
+    def test_alert_data_returns_the_same_dict_on_every_access(self) -> None:
+        self.assertIs(self.test_github_alert.alert_data,
+                      self.test_github_alert.alert_data)
+
+    def test_alert_data_returns_the_alert_details(self) -> None:
+        expected_data = {
+            'alert_code': {
+                'name': GithubAlertCode.NewGitHubReleaseAlert.name,
+                'code': GithubAlertCode.NewGitHubReleaseAlert.value
+            },
+            'metric': GroupedGithubAlertsMetricCode.GithubRelease.value,
+            'message': "Repo: {} has a new release {} tagged {}.".format(
+                self.test_origin_name, 'test_release', 'v1.0.0'),
+            'severity': self.test_severity,
+            'parent_id': self.test_parent_id,
+            'origin_id': self.test_origin_id,
+            'timestamp': self.test_timestamp,
+            'metric_state_args': [self.test_origin_id]
+        }
+
+        self.assertEqual(expected_data, self.test_github_alert.alert_data)
+
+    def test_github_alert_has_no_instance_dict(self) -> None:
+        self.assertFalse(hasattr(self.test_github_alert, '__dict__'))
+
+    def test_alert_without_slots_still_builds_alert_data(self) -> None:
+        alert_data = self.test_system_alert.alert_data
+
+        self.assertTrue(hasattr(self.test_system_alert, '__dict__'))
+        self.assertIs(alert_data, self.test_system_alert.alert_data)
+        self.assertEqual({
+            'name': SystemAlertCode.SystemWentDownAtAlert.name,
+            'code': SystemAlertCode.SystemWentDownAtAlert.value
+        }, alert_data['alert_code'])
+        self.assertEqual(GroupedSystemAlertsMetricCode.SystemIsDown.value,
+                         alert_data['metric'])
+        self.assertEqual([self.test_origin_id],
+                         alert_data['metric_state_args'])